@@ -0,0 +1,88 @@
+import asyncio
+import logging
+import os
+from typing import Any, Awaitable, Callable
+
+import orjson
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+REDIS_URL = os.getenv("REDIS_URL")
+CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "30"))
+REDIS_TIMEOUT_SECONDS = float(os.getenv("REDIS_TIMEOUT_SECONDS", "0.3"))
+LOCK_TTL_SECONDS = 5
+LOCK_WAIT_SECONDS = 0.05
+
+logger = logging.getLogger("contracts-service")
+
+redis_client: Redis | None = (
+    Redis.from_url(
+        REDIS_URL,
+        socket_timeout=REDIS_TIMEOUT_SECONDS,
+        socket_connect_timeout=REDIS_TIMEOUT_SECONDS,
+    )
+    if REDIS_URL
+    else None
+)
+
+
+def stats_key(owner_user_id: str) -> str:
+    return f"v1:contracts:{owner_user_id}:stats"
+
+
+def recent_key(owner_user_id: str) -> str:
+    return f"v1:contracts:{owner_user_id}:recent"
+
+
+async def cache_aside(
+    key: str, loader: Callable[[], Awaitable[Any]], ttl: int = CACHE_TTL_SECONDS
+) -> Any:
+    """Return the cached JSON value for ``key`` or build it with ``loader``.
+
+    Only one caller rebuilds a missing key at a time (``SET key:lock NX``);
+    the others wait briefly for it and fall back to the loader if the value
+    still is not there. Redis failures never fail the request.
+    """
+    if redis_client is None:
+        return await loader()
+
+    lock_key = f"{key}:lock"
+    lock_acquired = False
+    try:
+        cached = await redis_client.get(key)
+        if cached is None:
+            lock_acquired = bool(
+                await redis_client.set(lock_key, b"1", nx=True, ex=LOCK_TTL_SECONDS)
+            )
+            if not lock_acquired:
+                await asyncio.sleep(LOCK_WAIT_SECONDS)
+                cached = await redis_client.get(key)
+    except RedisError:
+        logger.warning("Redis no disponible, leyendo %s desde la base de datos.", key)
+        return await loader()
+
+    if cached is not None:
+        return orjson.loads(cached)
+
+    value = await loader()
+    if lock_acquired:
+        try:
+            await redis_client.set(key, orjson.dumps(value), ex=ttl)
+            await redis_client.delete(lock_key)
+        except RedisError:
+            logger.warning("No se pudo guardar %s en Redis.", key)
+    return value
+
+
+async def invalidate_owner(owner_user_id: str) -> None:
+    if redis_client is None:
+        return
+    try:
+        await redis_client.delete(stats_key(owner_user_id), recent_key(owner_user_id))
+    except RedisError:
+        logger.warning("No se pudo invalidar la caché de %s.", owner_user_id)
+
+
+async def close() -> None:
+    if redis_client is not None:
+        await redis_client.aclose()
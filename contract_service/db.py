@@ -1,12 +1,37 @@
+import asyncio
+import logging
 import os
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
+import orjson
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
 
-engine = create_async_engine(DATABASE_URL, pool_pre_ping=True)
+logger = logging.getLogger("contracts-service")
+
+
+def _json_dumps(value: Any) -> str:
+    return orjson.dumps(value).decode()
+
+
+engine = create_async_engine(
+    DATABASE_URL,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=0,
+    pool_recycle=1800,
+    insertmanyvalues_page_size=1000,
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
+    connect_args={
+        "server_settings": {"jit": "off"},
+        "statement_cache_size": 2048,
+        "prepared_statement_cache_size": 2048,
+    },
+)
 SessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 Base = declarative_base()
@@ -15,3 +40,21 @@ Base = declarative_base()
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with SessionLocal() as session:
         yield session
+
+
+async def warm_up_pool() -> None:
+    async def open_connection() -> None:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    results = await asyncio.gather(
+        *(open_connection() for _ in range(DB_POOL_SIZE)), return_exceptions=True
+    )
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        logger.warning(
+            "No se pudieron abrir %d de %d conexiones al precalentar el pool.",
+            len(errors),
+            DB_POOL_SIZE,
+            exc_info=errors[0],
+        )
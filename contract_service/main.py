@@ -1,11 +1,30 @@
 import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
+from . import cache
+from .db import engine, warm_up_pool
 from .routers.contracts import router as contracts_router
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("contracts-service")
 
-app = FastAPI(title="Contractify Contracts Service", version="1.0.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    await warm_up_pool()
+    yield
+    await cache.close()
+    await engine.dispose()
+
+
+app = FastAPI(
+    title="Contractify Contracts Service",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 app.include_router(contracts_router)
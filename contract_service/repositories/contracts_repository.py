@@ -1,62 +1,143 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Iterable
-
-from sqlalchemy import and_, desc, func, or_, select, text, update
+from typing import Iterable, Literal
+
+from sqlalchemy import (
+    BindParameter,
+    ColumnElement,
+    Lateral,
+    Row,
+    and_,
+    any_,
+    bindparam,
+    delete,
+    desc,
+    func,
+    insert,
+    lambda_stmt,
+    literal,
+    literal_column,
+    or_,
+    select,
+    true,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from .models import ActivityLog, Contract, ContractParty, ContractVersion
 
+_SORT_COLUMNS = {
+    "createdAt": Contract.created_at,
+    "updatedAt": Contract.updated_at,
+    "title": Contract.title,
+    "status": Contract.status,
+}
+
+
+def _latest_version_content() -> Lateral:
+    return (
+        select(ContractVersion.content)
+        .where(ContractVersion.contract_id == Contract.id)
+        .order_by(desc(ContractVersion.version))
+        .limit(1)
+        .lateral("latest_version")
+    )
+
+
+def _uuid_array(ids: Iterable[str]) -> BindParameter:
+    return bindparam("ids", list(ids), type_=ARRAY(UUID(as_uuid=False)))
+
+
+def _owned_by(owner_user_id: str) -> ColumnElement[bool]:
+    return and_(
+        Contract.owner_user_id == owner_user_id,
+        Contract.deleted_at.is_(None),
+    )
+
 
 async def get_contract(
     session: AsyncSession, contract_id: str, include_deleted: bool = False
 ) -> Contract | None:
-    query = select(Contract).where(Contract.id == contract_id)
+    query = lambda_stmt(lambda: select(Contract).where(Contract.id == contract_id))
     if not include_deleted:
-        query = query.where(Contract.deleted_at.is_(None))
+        query += lambda q: q.where(Contract.deleted_at.is_(None))
     result = await session.execute(query)
     return result.scalar_one_or_none()
 
 
+async def get_contract_with_content(
+    session: AsyncSession, contract_id: str
+) -> tuple[Contract, str] | None:
+    latest_version = _latest_version_content()
+    result = await session.execute(
+        select(Contract, latest_version.c.content)
+        .outerjoin(latest_version, true())
+        .where(Contract.id == contract_id)
+        .where(Contract.deleted_at.is_(None))
+        .options(selectinload(Contract.parties))
+    )
+    row = result.one_or_none()
+    if row is None:
+        return None
+    contract, content = row
+    return contract, content or ""
+
+
 async def create_contract(
     session: AsyncSession,
     title: str,
     contract_type: str,
     template_id: str,
     owner_user_id: str,
-    metadata: dict,
+    contract_metadata: dict,
 ) -> Contract:
-    contract = Contract(
-        title=title,
-        contract_type=contract_type,
-        template_id=template_id,
-        owner_user_id=owner_user_id,
-        metadata=metadata,
-        status="DRAFT",
+    result = await session.execute(
+        insert(Contract)
+        .values(
+            title=title,
+            contract_type=contract_type,
+            template_id=template_id,
+            owner_user_id=owner_user_id,
+            contract_metadata=contract_metadata,
+            status="DRAFT",
+        )
+        .returning(Contract)
     )
-    session.add(contract)
-    await session.flush()
-    return contract
+    return result.scalar_one()
 
 
 async def update_contract_fields(
     session: AsyncSession, contract_id: str, fields: dict
-) -> None:
+) -> Row | None:
     if not fields:
-        return
-    await session.execute(
+        return None
+    # Returned as a Core row: RETURNING into the already-loaded Contract would
+    # leave server-set columns such as updated_at stale in the identity map.
+    result = await session.execute(
         update(Contract)
         .where(Contract.id == contract_id)
         .values(**fields)
+        .returning(*Contract.__table__.c)
     )
+    return result.one()
 
 
 async def soft_delete_contract(session: AsyncSession, contract_id: str) -> None:
     await session.execute(
         update(Contract)
         .where(Contract.id == contract_id)
-        .values(deleted_at=datetime.utcnow())
+        .values(deleted_at=func.now())
+    )
+
+
+async def update_contract_status(session: AsyncSession, contract_id: str, status: str) -> None:
+    await session.execute(
+        update(Contract)
+        .where(Contract.id == contract_id)
+        .values(status=status, signed_at=func.now() if status == "SIGNED" else None)
     )
 
 
@@ -68,46 +149,101 @@ async def add_version(
     source: str,
     created_by: str,
 ) -> ContractVersion:
-    contract_version = ContractVersion(
-        contract_id=contract_id,
-        version=version,
-        content=content,
-        source=source,
-        created_by=created_by,
+    result = await session.execute(
+        insert(ContractVersion)
+        .values(
+            contract_id=contract_id,
+            version=version,
+            content=content,
+            source=source,
+            created_by=created_by,
+        )
+        .returning(ContractVersion)
     )
-    session.add(contract_version)
-    await session.flush()
-    return contract_version
+    return result.scalar_one()
 
 
 async def get_latest_version(session: AsyncSession, contract_id: str) -> ContractVersion | None:
     result = await session.execute(
-        select(ContractVersion)
-        .where(ContractVersion.contract_id == contract_id)
-        .order_by(desc(ContractVersion.version))
-        .limit(1)
+        lambda_stmt(
+            lambda: select(ContractVersion)
+            .where(ContractVersion.contract_id == contract_id)
+            .order_by(desc(ContractVersion.version))
+            .limit(1)
+        )
     )
     return result.scalar_one_or_none()
 
 
+async def copy_latest_version(
+    session: AsyncSession, source_contract_id: str, target_contract_id: str, created_by: str
+) -> None:
+    await session.execute(
+        insert(ContractVersion).from_select(
+            ["contract_id", "version", "content", "source", "created_by"],
+            select(
+                literal(target_contract_id, UUID(as_uuid=False)),
+                literal_column("1"),
+                ContractVersion.content,
+                literal_column("'USER'"),
+                literal(created_by),
+            )
+            .where(ContractVersion.contract_id == source_contract_id)
+            .order_by(desc(ContractVersion.version))
+            .limit(1),
+        )
+    )
+
+
+async def get_latest_contents(
+    session: AsyncSession, contract_ids: list[str]
+) -> dict[str, str]:
+    result = await session.execute(
+        select(ContractVersion.contract_id, ContractVersion.content)
+        .where(ContractVersion.contract_id == any_(_uuid_array(contract_ids)))
+        .distinct(ContractVersion.contract_id)
+        .order_by(ContractVersion.contract_id, desc(ContractVersion.version))
+    )
+    return {contract_id: content for contract_id, content in result.all()}
+
+
 async def list_versions(session: AsyncSession, contract_id: str) -> list[ContractVersion]:
     result = await session.execute(
-        select(ContractVersion)
-        .where(ContractVersion.contract_id == contract_id)
-        .order_by(desc(ContractVersion.version))
+        lambda_stmt(
+            lambda: select(ContractVersion)
+            .where(ContractVersion.contract_id == contract_id)
+            .order_by(desc(ContractVersion.version))
+        )
     )
     return list(result.scalars().all())
 
 
 async def list_parties(session: AsyncSession, contract_id: str) -> list[ContractParty]:
     result = await session.execute(
-        select(ContractParty)
-        .where(ContractParty.contract_id == contract_id)
-        .order_by(ContractParty.signing_order)
+        lambda_stmt(
+            lambda: select(ContractParty)
+            .where(ContractParty.contract_id == contract_id)
+            .order_by(ContractParty.signing_order)
+        )
     )
     return list(result.scalars().all())
 
 
+async def get_public_view_party(session: AsyncSession, contract_id: str) -> ContractParty | None:
+    result = await session.execute(
+        lambda_stmt(
+            lambda: select(ContractParty)
+            .where(ContractParty.contract_id == contract_id)
+            .order_by(
+                ContractParty.signature_status == literal_column("'SIGNED'"),
+                ContractParty.signing_order,
+            )
+            .limit(1)
+        )
+    )
+    return result.scalar_one_or_none()
+
+
 async def add_party(
     session: AsyncSession,
     contract_id: str,
@@ -116,30 +252,45 @@ async def add_party(
     email: str,
     signing_order: int,
 ) -> ContractParty:
-    party = ContractParty(
-        contract_id=contract_id,
-        role=role,
-        name=name,
-        email=email,
-        signing_order=signing_order,
-        signature_status="PENDING",
+    result = await session.execute(
+        insert(ContractParty)
+        .values(
+            contract_id=contract_id,
+            role=role,
+            name=name,
+            email=email,
+            signing_order=signing_order,
+            signature_status="PENDING",
+        )
+        .returning(ContractParty)
+    )
+    return result.scalar_one()
+
+
+async def copy_parties(session: AsyncSession, source_contract_id: str, target_contract_id: str) -> None:
+    await session.execute(
+        insert(ContractParty).from_select(
+            ["contract_id", "role", "name", "email", "signing_order", "signature_status"],
+            select(
+                literal(target_contract_id, UUID(as_uuid=False)),
+                ContractParty.role,
+                ContractParty.name,
+                ContractParty.email,
+                ContractParty.signing_order,
+                literal_column("'PENDING'"),
+            ).where(ContractParty.contract_id == source_contract_id),
+        )
     )
-    session.add(party)
-    await session.flush()
-    return party
 
 
 async def remove_party(session: AsyncSession, contract_id: str, party_id: str) -> int:
     result = await session.execute(
-        text(
-            """
-            DELETE FROM contracts.contract_parties
-            WHERE contract_id = :contract_id AND id = :party_id
-            """
-        ),
-        {"contract_id": contract_id, "party_id": party_id},
+        delete(ContractParty)
+        .where(ContractParty.contract_id == contract_id)
+        .where(ContractParty.id == party_id)
+        .returning(ContractParty.id)
     )
-    return result.rowcount or 0
+    return len(result.scalars().all())
 
 
 async def get_next_version_number(session: AsyncSession, contract_id: str) -> int:
@@ -159,23 +310,27 @@ async def log_activity(
     user_name: str,
     details: dict,
 ) -> ActivityLog:
-    log = ActivityLog(
-        contract_id=contract_id,
-        action=action,
-        user_id=user_id,
-        user_name=user_name,
-        details=details,
+    result = await session.execute(
+        insert(ActivityLog)
+        .values(
+            contract_id=contract_id,
+            action=action,
+            user_id=user_id,
+            user_name=user_name,
+            details=details,
+        )
+        .returning(ActivityLog)
     )
-    session.add(log)
-    await session.flush()
-    return log
+    return result.scalar_one()
 
 
 async def list_activity_logs(session: AsyncSession, contract_id: str) -> list[ActivityLog]:
     result = await session.execute(
-        select(ActivityLog)
-        .where(ActivityLog.contract_id == contract_id)
-        .order_by(desc(ActivityLog.timestamp))
+        lambda_stmt(
+            lambda: select(ActivityLog)
+            .where(ActivityLog.contract_id == contract_id)
+            .order_by(desc(ActivityLog.timestamp))
+        )
     )
     return list(result.scalars().all())
 
@@ -188,37 +343,13 @@ async def list_contracts(
     template_id: str | None,
     from_date: datetime | None,
     to_date: datetime | None,
-    sort_by: str,
-    sort_order: str,
+    sort_by: Literal["createdAt", "updatedAt", "title", "status"],
+    sort_order: Literal["asc", "desc"],
     page: int,
     page_size: int,
 ) -> tuple[list[Contract], int]:
-    latest_versions = (
-        select(
-            ContractVersion.contract_id,
-            func.max(ContractVersion.version).label("max_version"),
-        )
-        .group_by(ContractVersion.contract_id)
-        .subquery()
-    )
-
-    latest_content = (
-        select(ContractVersion.contract_id, ContractVersion.content)
-        .join(
-            latest_versions,
-            and_(
-                ContractVersion.contract_id == latest_versions.c.contract_id,
-                ContractVersion.version == latest_versions.c.max_version,
-            ),
-        )
-        .subquery()
-    )
-
-    query = (
-        select(Contract)
-        .outerjoin(latest_content, Contract.id == latest_content.c.contract_id)
-        .where(Contract.owner_user_id == owner_user_id)
-        .where(Contract.deleted_at.is_(None))
+    query = select(Contract, func.count().over().label("total")).where(
+        _owned_by(owner_user_id)
     )
 
     if status:
@@ -230,39 +361,38 @@ async def list_contracts(
     if to_date:
         query = query.where(Contract.created_at <= to_date)
     if search:
+        latest_version = _latest_version_content()
         search_like = f"%{search}%"
-        query = query.where(
+        query = query.outerjoin(latest_version, true()).where(
             or_(
                 Contract.title.ilike(search_like),
-                latest_content.c.content.ilike(search_like),
+                latest_version.c.content.ilike(search_like),
             )
         )
 
-    sort_column = {
-        "createdAt": Contract.created_at,
-        "updatedAt": Contract.updated_at,
-        "title": Contract.title,
-        "status": Contract.status,
-    }.get(sort_by, Contract.created_at)
-
-    if sort_order.lower() == "asc":
-        query = query.order_by(sort_column.asc())
-    else:
-        query = query.order_by(sort_column.desc())
-
-    count_query = select(func.count(func.distinct(Contract.id))).select_from(query.subquery())
-    total = (await session.execute(count_query)).scalar_one()
-
-    query = query.offset((page - 1) * page_size).limit(page_size)
-    result = await session.execute(query)
-    return list(result.scalars().all()), int(total)
+    sort_column = _SORT_COLUMNS[sort_by]
+    page_query = (
+        query.order_by(sort_column.asc() if sort_order == "asc" else sort_column.desc())
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+    )
+    rows = (await session.execute(page_query)).all()
+    if rows:
+        return [contract for contract, _ in rows], int(rows[0].total)
+    if page == 1:
+        return [], 0
+
+    # Past the last page the window count has no row to ride on.
+    total = await session.scalar(
+        query.with_only_columns(func.count(), maintain_column_froms=True)
+    )
+    return [], int(total or 0)
 
 
 async def list_recent_contracts(session: AsyncSession, owner_user_id: str) -> list[Contract]:
     result = await session.execute(
         select(Contract)
-        .where(Contract.owner_user_id == owner_user_id)
-        .where(Contract.deleted_at.is_(None))
+        .where(_owned_by(owner_user_id))
         .order_by(desc(Contract.created_at))
         .limit(10)
     )
@@ -270,61 +400,59 @@ async def list_recent_contracts(session: AsyncSession, owner_user_id: str) -> li
 
 
 async def list_pending_contracts(session: AsyncSession, owner_user_id: str) -> list[Contract]:
-    unsigned_party_exists = (
-        select(ContractParty.id)
-        .where(ContractParty.contract_id == Contract.id)
-        .where(ContractParty.signature_status != "SIGNED")
-        .exists()
-    )
     result = await session.execute(
         select(Contract)
-        .where(Contract.owner_user_id == owner_user_id)
-        .where(Contract.deleted_at.is_(None))
-        .where(Contract.status == "SIGNING")
-        .where(unsigned_party_exists)
+        .join(ContractParty, ContractParty.contract_id == Contract.id)
+        .where(_owned_by(owner_user_id))
+        .where(Contract.status == literal_column("'SIGNING'"))
+        .where(ContractParty.signature_status != literal_column("'SIGNED'"))
+        .group_by(Contract.id)
         .order_by(desc(Contract.updated_at))
     )
     return list(result.scalars().all())
 
 
-async def count_pending_signatures(session: AsyncSession, owner_user_id: str) -> int:
+async def dashboard_counts(
+    session: AsyncSession, owner_user_id: str
+) -> tuple[dict[str, int], int, int]:
+    owned = _owned_by(owner_user_id)
     unsigned_party_exists = (
         select(ContractParty.id)
         .where(ContractParty.contract_id == Contract.id)
         .where(ContractParty.signature_status != "SIGNED")
         .exists()
     )
-    result = await session.execute(
-        select(func.count())
-        .select_from(Contract)
-        .where(Contract.owner_user_id == owner_user_id)
-        .where(Contract.deleted_at.is_(None))
-        .where(Contract.status == "SIGNING")
-        .where(unsigned_party_exists)
-    )
-    return int(result.scalar_one())
-
-
-async def contract_status_counts(session: AsyncSession, owner_user_id: str) -> dict[str, int]:
-    result = await session.execute(
-        select(Contract.status, func.count())
-        .where(Contract.owner_user_id == owner_user_id)
-        .where(Contract.deleted_at.is_(None))
+    status_counts = (
+        select(Contract.status, func.count().label("total"))
+        .where(owned)
         .group_by(Contract.status)
+        .subquery()
     )
-    return {row[0]: int(row[1]) for row in result.all()}
+    by_status = select(
+        func.jsonb_object_agg(status_counts.c.status, status_counts.c.total, type_=JSONB)
+    ).scalar_subquery()
 
-
-async def count_signed_this_month(session: AsyncSession, owner_user_id: str) -> int:
     result = await session.execute(
-        select(func.count())
+        select(
+            by_status.label("by_status"),
+            func.count()
+            .filter(and_(Contract.status == "SIGNING", unsigned_party_exists))
+            .label("pending_signatures"),
+            func.count()
+            .filter(
+                and_(
+                    Contract.status == "SIGNED",
+                    Contract.signed_at >= func.date_trunc("month", func.now()),
+                )
+            )
+            .label("signed_this_month"),
+        )
         .select_from(Contract)
-        .where(Contract.owner_user_id == owner_user_id)
-        .where(Contract.deleted_at.is_(None))
-        .where(Contract.status == "SIGNED")
-        .where(Contract.signed_at >= func.date_trunc("month", func.now()))
+        .where(owned)
     )
-    return int(result.scalar_one())
+    row = result.one()
+    status_map = {status: int(count) for status, count in (row.by_status or {}).items()}
+    return status_map, int(row.pending_signatures), int(row.signed_this_month)
 
 
 async def list_contracts_by_ids(
@@ -332,19 +460,20 @@ async def list_contracts_by_ids(
 ) -> list[Contract]:
     result = await session.execute(
         select(Contract)
-        .where(Contract.owner_user_id == owner_user_id)
-        .where(Contract.deleted_at.is_(None))
-        .where(Contract.id.in_(list(contract_ids)))
+        .where(_owned_by(owner_user_id))
+        .where(Contract.id == any_(_uuid_array(contract_ids)))
     )
     return list(result.scalars().all())
 
 
 async def all_parties_signed(session: AsyncSession, contract_id: str) -> bool:
     result = await session.execute(
-        select(func.count())
-        .select_from(ContractParty)
-        .where(ContractParty.contract_id == contract_id)
-        .where(ContractParty.signature_status != "SIGNED")
+        lambda_stmt(
+            lambda: select(func.count())
+            .select_from(ContractParty)
+            .where(ContractParty.contract_id == contract_id)
+            .where(ContractParty.signature_status != "SIGNED")
+        )
     )
     unsigned_count = int(result.scalar_one())
     return unsigned_count == 0
@@ -352,7 +481,9 @@ async def all_parties_signed(session: AsyncSession, contract_id: str) -> bool:
 
 async def max_signing_order(session: AsyncSession, contract_id: str) -> int:
     result = await session.execute(
-        select(func.coalesce(func.max(ContractParty.signing_order), 0))
-        .where(ContractParty.contract_id == contract_id)
+        lambda_stmt(
+            lambda: select(func.coalesce(func.max(ContractParty.signing_order), 0))
+            .where(ContractParty.contract_id == contract_id)
+        )
     )
     return int(result.scalar_one())
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func, text
@@ -10,7 +10,21 @@ from ..db import Base
 
 class Contract(Base):
     __tablename__ = "contracts"
-    __table_args__ = {"schema": "contracts"}
+    __table_args__ = (
+        Index(
+            "ix_contracts_owner_created",
+            "owner_user_id",
+            text("created_at DESC"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_contracts_owner_updated_signing",
+            "owner_user_id",
+            text("updated_at DESC"),
+            postgresql_where=text("deleted_at IS NULL AND status = 'SIGNING'"),
+        ),
+        {"schema": "contracts"},
+    )
 
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False), primary_key=True, server_default=text("gen_random_uuid()")
@@ -22,23 +36,33 @@ class Contract(Base):
     status: Mapped[str] = mapped_column(
         String(20), nullable=False, server_default=text("'DRAFT'")
     )
-    metadata: Mapped[dict] = mapped_column(
-        JSONB, nullable=False, server_default=text("'{}'::jsonb")
+    contract_metadata: Mapped[dict] = mapped_column(
+        "metadata", JSONB, nullable=False, server_default=text("'{}'::jsonb")
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, server_default=func.now()
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
     )
     signed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     deleted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
     versions = relationship(
-        "ContractVersion", back_populates="contract", cascade="all, delete-orphan"
+        "ContractVersion",
+        back_populates="contract",
+        cascade="all, delete-orphan",
+        lazy="raise",
     )
     parties = relationship(
-        "ContractParty", back_populates="contract", cascade="all, delete-orphan"
+        "ContractParty",
+        back_populates="contract",
+        cascade="all, delete-orphan",
+        lazy="raise",
+        order_by="ContractParty.signing_order",
     )
     activity_logs = relationship(
         "ActivityLog", back_populates="contract", cascade="all, delete-orphan"
@@ -47,7 +71,14 @@ class Contract(Base):
 
 class ContractVersion(Base):
     __tablename__ = "contract_versions"
-    __table_args__ = {"schema": "contracts"}
+    __table_args__ = (
+        Index(
+            "ix_contract_versions_contract_version",
+            "contract_id",
+            text("version DESC"),
+        ),
+        {"schema": "contracts"},
+    )
 
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False), primary_key=True, server_default=text("gen_random_uuid()")
@@ -70,7 +101,14 @@ class ContractVersion(Base):
 
 class ContractParty(Base):
     __tablename__ = "contract_parties"
-    __table_args__ = {"schema": "contracts"}
+    __table_args__ = (
+        Index(
+            "ix_contract_parties_contract_unsigned",
+            "contract_id",
+            postgresql_where=text("signature_status <> 'SIGNED'"),
+        ),
+        {"schema": "contracts"},
+    )
 
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False), primary_key=True, server_default=text("gen_random_uuid()")
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import hashlib
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..db import get_session
-from ..schemas.activity import ActivityLogOut
+from ..schemas.activity import ACTIVITY_LOG_OUT_LIST, ActivityLogOut
 from ..schemas.contracts import (
+    CONTRACT_OUT_LIST,
+    CONTRACT_VERSION_LIST,
     BulkDownloadRequest,
     ContractDetailOut,
     ContractFilters,
@@ -21,7 +25,7 @@ from ..schemas.contracts import (
     UpdateContractRequest,
     UpdateContractStatusRequest,
 )
-from ..schemas.parties import AddPartyRequest, ContractPartyOut
+from ..schemas.parties import PARTY_OUT_LIST, AddPartyRequest, ContractPartyOut
 from ..services import contracts_service as service
 
 router = APIRouter()
@@ -37,14 +41,48 @@ def get_user_context(
     return service.UserContext(user_id=x_user_id, user_email=x_user_email, user_role=x_user_role)
 
 
+def _weak_etag(*parts: object) -> str:
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _contracts_etag(contracts: list[ContractOut], *extra: object) -> str:
+    return _weak_etag([(contract.id, contract.updated_at) for contract in contracts], *extra)
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison: W/"x" and "x" are the same tag.
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque_tag for tag in if_none_match.split(",")
+    )
+
+
+def _json_response(content: bytes, etag: str | None = None) -> Response:
+    headers = {"ETag": etag} if etag else None
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
 @router.get("/contracts", response_model=ContractListResponse)
 async def list_contracts(
+    request: Request,
     filters: Annotated[ContractFilters, Depends()],
     session: Annotated[AsyncSession, Depends(get_session)],
     user: Annotated[service.UserContext, Depends(get_user_context)],
-) -> ContractListResponse:
+) -> Response:
     try:
-        return await service.list_contracts(session, user, filters)
+        contracts = await service.list_contracts(session, user, filters)
+        etag = _contracts_etag(contracts.data, contracts.pagination.total_items)
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        return _json_response(
+            ContractListResponse.__pydantic_serializer__.to_json(contracts, by_alias=True), etag
+        )
     except service.ServiceError as exc:
         raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
 
@@ -74,22 +112,32 @@ async def get_stats(
 
 @router.get("/contracts/recent", response_model=list[ContractOut])
 async def recent_contracts(
+    request: Request,
     session: Annotated[AsyncSession, Depends(get_session)],
     user: Annotated[service.UserContext, Depends(get_user_context)],
-) -> list[ContractOut]:
+) -> Response:
     try:
-        return await service.list_recent_contracts(session, user)
+        contracts = await service.list_recent_contracts(session, user)
+        etag = _contracts_etag(contracts)
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        return _json_response(CONTRACT_OUT_LIST.dump_json(contracts, by_alias=True), etag)
     except service.ServiceError as exc:
         raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
 
 
 @router.get("/contracts/pending", response_model=list[ContractOut])
 async def pending_contracts(
+    request: Request,
     session: Annotated[AsyncSession, Depends(get_session)],
     user: Annotated[service.UserContext, Depends(get_user_context)],
-) -> list[ContractOut]:
+) -> Response:
     try:
-        return await service.list_pending_contracts(session, user)
+        contracts = await service.list_pending_contracts(session, user)
+        etag = _contracts_etag(contracts)
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        return _json_response(CONTRACT_OUT_LIST.dump_json(contracts, by_alias=True), etag)
     except service.ServiceError as exc:
         raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
 
@@ -97,11 +145,23 @@ async def pending_contracts(
 @router.get("/contracts/{contract_id}", response_model=ContractDetailOut)
 async def get_contract(
     contract_id: str,
+    request: Request,
     session: Annotated[AsyncSession, Depends(get_session)],
     user: Annotated[service.UserContext, Depends(get_user_context)],
-) -> ContractDetailOut:
+) -> Response:
     try:
-        return await service.get_contract_detail(session, user, contract_id)
+        contract = await service.get_contract_detail(session, user, contract_id)
+        etag = _weak_etag(
+            contract.id,
+            contract.updated_at,
+            contract.content,
+            [(party.id, party.signature_status, party.signed_at) for party in contract.parties],
+        )
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        return _json_response(
+            ContractDetailOut.__pydantic_serializer__.to_json(contract, by_alias=True), etag
+        )
     except service.ServiceError as exc:
         raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
 
@@ -163,9 +223,10 @@ async def get_versions(
     contract_id: str,
     session: Annotated[AsyncSession, Depends(get_session)],
     user: Annotated[service.UserContext, Depends(get_user_context)],
-) -> list[ContractVersionOut]:
+) -> Response:
     try:
-        return await service.list_versions(session, user, contract_id)
+        versions = await service.list_versions(session, user, contract_id)
+        return _json_response(CONTRACT_VERSION_LIST.dump_json(versions, by_alias=True))
     except service.ServiceError as exc:
         raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
 
@@ -201,10 +262,11 @@ async def get_history(
     contract_id: str,
     session: Annotated[AsyncSession, Depends(get_session)],
     user: Annotated[service.UserContext, Depends(get_user_context)],
-) -> list[ActivityLogOut]:
+) -> Response:
     try:
         logs = await service.list_activity(session, user, contract_id)
-        return [ActivityLogOut.model_validate(log) for log in logs]
+        history = ACTIVITY_LOG_OUT_LIST.validate_python(logs, from_attributes=True)
+        return _json_response(ACTIVITY_LOG_OUT_LIST.dump_json(history, by_alias=True))
     except service.ServiceError as exc:
         raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
 
@@ -214,9 +276,10 @@ async def get_parties(
     contract_id: str,
     session: Annotated[AsyncSession, Depends(get_session)],
     user: Annotated[service.UserContext, Depends(get_user_context)],
-) -> list[ContractPartyOut]:
+) -> Response:
     try:
-        return await service.list_parties(session, user, contract_id)
+        parties = await service.list_parties(session, user, contract_id)
+        return _json_response(PARTY_OUT_LIST.dump_json(parties, by_alias=True))
     except service.ServiceError as exc:
         raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
 
@@ -258,8 +321,8 @@ async def bulk_download(
     try:
         if not payload.contract_ids:
             raise HTTPException(status_code=400, detail="contractIds es requerido.")
-        zip_bytes = await service.bulk_download(session, user, payload.contract_ids)
-        return Response(content=zip_bytes, media_type="application/zip")
+        zip_chunks = await service.bulk_download(session, user, payload.contract_ids)
+        return StreamingResponse(zip_chunks, media_type="application/zip")
     except service.ServiceError as exc:
         raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
 
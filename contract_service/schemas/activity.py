@@ -4,7 +4,9 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import TypeAdapter
+
+from .base import CamelModel
 
 
 class ActivityAction(str, Enum):
@@ -16,12 +18,13 @@ class ActivityAction(str, Enum):
     CANCELLED = "CANCELLED"
 
 
-class ActivityLogOut(BaseModel):
+class ActivityLogOut(CamelModel):
     id: str
     action: ActivityAction
-    user_id: str = Field(alias="userId")
-    user_name: str = Field(alias="userName")
+    user_id: str
+    user_name: str
     details: dict[str, Any]
     timestamp: datetime
 
-    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+ACTIVITY_LOG_OUT_LIST = TypeAdapter(list[ActivityLogOut])
@@ -4,8 +4,9 @@ from datetime import date, datetime
 from enum import Enum
 from typing import Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
+from .base import CamelModel
 from .parties import ContractPartyOut
 from .signatures import SignatureOut
 
@@ -63,68 +64,61 @@ class BulkDownloadRequest(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
-class ContractOut(BaseModel):
+class ContractOut(CamelModel):
     id: str
     title: str
     status: ContractStatus
-    template_id: str = Field(alias="templateId")
-    contract_type: str = Field(alias="contractType")
-    owner_user_id: str = Field(alias="ownerUserId")
-    created_at: datetime = Field(alias="createdAt")
-    updated_at: datetime = Field(alias="updatedAt")
-    signed_at: datetime | None = Field(default=None, alias="signedAt")
-
-    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+    template_id: str
+    contract_type: str
+    owner_user_id: str
+    created_at: datetime
+    updated_at: datetime
+    signed_at: datetime | None = None
 
 
 class ContractDetailOut(ContractOut):
     content: str
     parties: list[ContractPartyOut]
-    signatures: list[SignatureOut]
-    document_url: str | None = Field(default=None, alias="documentUrl")
-    document_hash: str | None = Field(default=None, alias="documentHash")
-
-    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+    signatures: list[SignatureOut] = Field(default_factory=list)
+    document_url: str | None = None
+    document_hash: str | None = None
 
 
-class ContractVersionOut(BaseModel):
+class ContractVersionOut(CamelModel):
     version: int
     content: str
     source: Literal["AI", "USER"]
-    created_at: datetime = Field(alias="createdAt")
-    created_by: str = Field(alias="createdBy")
-
-    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
-
-
-class ContractListResponse(BaseModel):
-    data: list[ContractOut]
-    pagination: "PaginationOut"
+    created_at: datetime
+    created_by: str
 
 
-class PaginationOut(BaseModel):
+class PaginationOut(CamelModel):
     page: int
-    page_size: int = Field(alias="pageSize")
-    total_pages: int = Field(alias="totalPages")
-    total_items: int = Field(alias="totalItems")
+    page_size: int
+    total_pages: int
+    total_items: int
 
-    model_config = ConfigDict(populate_by_name=True)
 
+class ContractListResponse(CamelModel):
+    data: list[ContractOut]
+    pagination: PaginationOut
 
-class ContractStatsOut(BaseModel):
-    total: int
-    by_status: dict[str, int] = Field(alias="byStatus")
-    pending_signatures: int = Field(alias="pendingSignatures")
-    signed_this_month: int = Field(alias="signedThisMonth")
 
-    model_config = ConfigDict(populate_by_name=True)
+class ContractStatsOut(CamelModel):
+    total: int
+    by_status: dict[ContractStatus, int]
+    pending_signatures: int
+    signed_this_month: int
 
 
-class PublicContractViewOut(BaseModel):
+class PublicContractViewOut(CamelModel):
     id: str
     title: str
     content: str
     party: ContractPartyOut
-    document_url: str | None = Field(default=None, alias="documentUrl")
+    document_url: str | None = None
 
-    model_config = ConfigDict(populate_by_name=True)
+
+CONTRACT_OUT_LIST = TypeAdapter(list[ContractOut])
+CONTRACT_VERSION_LIST = TypeAdapter(list[ContractVersionOut])
+validate_contract_out = ContractOut.__pydantic_validator__.validate_python
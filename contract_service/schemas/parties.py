@@ -3,7 +3,9 @@ from __future__ import annotations
 from datetime import datetime
 from enum import Enum
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, Field, TypeAdapter
+
+from .base import CamelModel
 
 
 class PartyRole(str, Enum):
@@ -25,13 +27,14 @@ class AddPartyRequest(BaseModel):
     order: int | None = None
 
 
-class ContractPartyOut(BaseModel):
+class ContractPartyOut(CamelModel):
     id: str
     role: PartyRole
     name: str
     email: str
-    signature_status: SignatureStatus = Field(alias="signatureStatus")
-    signed_at: datetime | None = Field(default=None, alias="signedAt")
-    order: int = Field(alias="order", validation_alias="signing_order")
+    signature_status: SignatureStatus
+    signed_at: datetime | None = None
+    order: int = Field(validation_alias="signing_order")
+
 
-    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+PARTY_OUT_LIST = TypeAdapter(list[ContractPartyOut])
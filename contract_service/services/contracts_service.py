@@ -1,17 +1,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime
-from io import BytesIO
+from datetime import datetime, time, timezone
 from math import ceil
-from typing import Any, Iterable
-from zipfile import ZIP_DEFLATED, ZipFile
+from typing import Any, Iterable, Iterator
+from zipfile import ZIP_DEFLATED
 
 from sqlalchemy.ext.asyncio import AsyncSession
+from zipstream import ZipStream
 
+from .. import cache
 from ..repositories import contracts_repository as repo
+from ..repositories.models import Contract
 from ..schemas.activity import ActivityAction
 from ..schemas.contracts import (
+    CONTRACT_OUT_LIST,
+    CONTRACT_VERSION_LIST,
     ContractDetailOut,
     ContractFilters,
     ContractListResponse,
@@ -23,12 +27,12 @@ from ..schemas.contracts import (
     UpdateContractContentRequest,
     UpdateContractRequest,
     UpdateContractStatusRequest,
+    validate_contract_out,
 )
-from ..schemas.parties import AddPartyRequest, ContractPartyOut
-from ..schemas.signatures import SignatureOut
+from ..schemas.parties import PARTY_OUT_LIST, AddPartyRequest, ContractPartyOut
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserContext:
     user_id: str
     user_email: str
@@ -46,15 +50,34 @@ class ServiceError(Exception):
         self.message = message
 
 
-ALLOWED_TRANSITIONS: dict[str, list[str]] = {
-    "DRAFT": ["GENERATED", "CANCELLED", "EXPIRED"],
-    "GENERATED": ["SIGNING", "CANCELLED", "EXPIRED"],
-    "SIGNING": ["SIGNED", "CANCELLED", "EXPIRED"],
-    "SIGNED": [],
-    "CANCELLED": [],
-    "EXPIRED": [],
+async def _authorized_contract(
+    session: AsyncSession, user: UserContext, contract_id: str
+) -> Contract:
+    contract = await repo.get_contract(session, contract_id)
+    if not contract:
+        raise ServiceError(404, "Contrato no encontrado.")
+    if contract.owner_user_id != user.user_id:
+        raise ServiceError(403, "No tienes acceso a este contrato.")
+    return contract
+
+
+ALLOWED_TRANSITIONS: dict[str, tuple[str, ...]] = {
+    "DRAFT": ("GENERATED", "CANCELLED", "EXPIRED"),
+    "GENERATED": ("SIGNING", "CANCELLED", "EXPIRED"),
+    "SIGNING": ("SIGNED", "CANCELLED", "EXPIRED"),
+    "SIGNED": (),
+    "CANCELLED": (),
+    "EXPIRED": (),
+}
+ALLOWED_TRANSITION_SETS: dict[str, frozenset[str]] = {
+    status: frozenset(targets) for status, targets in ALLOWED_TRANSITIONS.items()
 }
 
+ZIP_COMPRESS_LEVEL = 1
+
+DAY_START = time.min.replace(tzinfo=timezone.utc)
+DAY_END = time.max.replace(tzinfo=timezone.utc)
+
 STATUS_ACTION = {
     "GENERATED": ActivityAction.GENERATED,
     "SIGNING": ActivityAction.SENT,
@@ -68,16 +91,8 @@ STATUS_ACTION = {
 async def list_contracts(
     session: AsyncSession, user: UserContext, filters: ContractFilters
 ) -> ContractListResponse:
-    from_date = (
-        datetime.combine(filters.from_date, datetime.min.time())
-        if filters.from_date
-        else None
-    )
-    to_date = (
-        datetime.combine(filters.to_date, datetime.max.time())
-        if filters.to_date
-        else None
-    )
+    from_date = datetime.combine(filters.from_date, DAY_START) if filters.from_date else None
+    to_date = datetime.combine(filters.to_date, DAY_END) if filters.to_date else None
     contracts, total = await repo.list_contracts(
         session=session,
         owner_user_id=user.user_id,
@@ -93,7 +108,7 @@ async def list_contracts(
     )
     total_pages = ceil(total / filters.page_size) if total else 1
     return ContractListResponse(
-        data=[ContractOut.model_validate(contract) for contract in contracts],
+        data=CONTRACT_OUT_LIST.validate_python(contracts, from_attributes=True),
         pagination=PaginationOut(
             page=filters.page,
             pageSize=filters.page_size,
@@ -112,7 +127,7 @@ async def create_contract(
         contract_type=payload["contract_type"],
         template_id=payload["template_id"],
         owner_user_id=user.user_id,
-        metadata={},
+        contract_metadata={},
     )
     await repo.log_activity(
         session=session,
@@ -123,39 +138,41 @@ async def create_contract(
         details={},
     )
     await session.commit()
-    return ContractOut.model_validate(contract)
+    await cache.invalidate_owner(user.user_id)
+    return validate_contract_out(contract)
 
 
 async def get_contract_detail(
     session: AsyncSession, user: UserContext, contract_id: str
 ) -> ContractDetailOut:
-    contract = await repo.get_contract(session, contract_id)
-    if not contract:
+    row = await repo.get_contract_with_content(session, contract_id)
+    if not row:
         raise ServiceError(404, "Contrato no encontrado.")
+    contract, content = row
     if contract.owner_user_id != user.user_id:
         raise ServiceError(403, "No tienes acceso a este contrato.")
 
-    latest_version = await repo.get_latest_version(session, contract_id)
-    parties = await repo.list_parties(session, contract_id)
-    content = latest_version.content if latest_version else ""
-    return ContractDetailOut(
-        **ContractOut.model_validate(contract).model_dump(by_alias=True),
-        content=content,
-        parties=[ContractPartyOut.model_validate(party) for party in parties],
-        signatures=[],
-        documentUrl=None,
-        documentHash=None,
+    return ContractDetailOut.model_validate(
+        {
+            "id": contract.id,
+            "title": contract.title,
+            "status": contract.status,
+            "template_id": contract.template_id,
+            "contract_type": contract.contract_type,
+            "owner_user_id": contract.owner_user_id,
+            "created_at": contract.created_at,
+            "updated_at": contract.updated_at,
+            "signed_at": contract.signed_at,
+            "content": content,
+            "parties": contract.parties,
+        }
     )
 
 
 async def update_contract(
     session: AsyncSession, user: UserContext, contract_id: str, payload: UpdateContractRequest
 ) -> ContractOut:
-    contract = await repo.get_contract(session, contract_id)
-    if not contract:
-        raise ServiceError(404, "Contrato no encontrado.")
-    if contract.owner_user_id != user.user_id:
-        raise ServiceError(403, "No tienes acceso a este contrato.")
+    contract = await _authorized_contract(session, user, contract_id)
 
     update_fields: dict[str, Any] = {}
     details: dict[str, Any] = {}
@@ -163,7 +180,7 @@ async def update_contract(
         update_fields["title"] = payload.title
         details["title"] = payload.title
 
-    await repo.update_contract_fields(session, contract_id, update_fields)
+    updated = await repo.update_contract_fields(session, contract_id, update_fields)
     if update_fields:
         await repo.log_activity(
             session=session,
@@ -174,16 +191,12 @@ async def update_contract(
             details={"changedFields": details},
         )
     await session.commit()
-    updated = await repo.get_contract(session, contract_id)
-    return ContractOut.model_validate(updated)
+    await cache.invalidate_owner(user.user_id)
+    return validate_contract_out(updated or contract)
 
 
 async def delete_contract(session: AsyncSession, user: UserContext, contract_id: str) -> None:
-    contract = await repo.get_contract(session, contract_id)
-    if not contract:
-        raise ServiceError(404, "Contrato no encontrado.")
-    if contract.owner_user_id != user.user_id:
-        raise ServiceError(403, "No tienes acceso a este contrato.")
+    contract = await _authorized_contract(session, user, contract_id)
     if contract.status == "SIGNED":
         raise ServiceError(409, "No se puede eliminar un contrato firmado.")
 
@@ -197,16 +210,13 @@ async def delete_contract(session: AsyncSession, user: UserContext, contract_id:
         details={"softDelete": True},
     )
     await session.commit()
+    await cache.invalidate_owner(user.user_id)
 
 
 async def duplicate_contract(
     session: AsyncSession, user: UserContext, contract_id: str
 ) -> ContractOut:
-    contract = await repo.get_contract(session, contract_id)
-    if not contract:
-        raise ServiceError(404, "Contrato no encontrado.")
-    if contract.owner_user_id != user.user_id:
-        raise ServiceError(403, "No tienes acceso a este contrato.")
+    contract = await _authorized_contract(session, user, contract_id)
 
     new_contract = await repo.create_contract(
         session=session,
@@ -214,30 +224,11 @@ async def duplicate_contract(
         contract_type=contract.contract_type,
         template_id=contract.template_id,
         owner_user_id=user.user_id,
-        metadata=contract.metadata or {},
+        contract_metadata=contract.contract_metadata or {},
     )
 
-    latest_version = await repo.get_latest_version(session, contract_id)
-    if latest_version:
-        await repo.add_version(
-            session=session,
-            contract_id=new_contract.id,
-            version=1,
-            content=latest_version.content,
-            source="USER",
-            created_by=user.user_id,
-        )
-
-    parties = await repo.list_parties(session, contract_id)
-    for party in parties:
-        await repo.add_party(
-            session=session,
-            contract_id=new_contract.id,
-            role=party.role,
-            name=party.name,
-            email=party.email,
-            signing_order=party.signing_order,
-        )
+    await repo.copy_latest_version(session, contract_id, new_contract.id, user.user_id)
+    await repo.copy_parties(session, contract_id, new_contract.id)
 
     await repo.log_activity(
         session=session,
@@ -248,7 +239,8 @@ async def duplicate_contract(
         details={"duplicatedFrom": contract_id},
     )
     await session.commit()
-    return ContractOut.model_validate(new_contract)
+    await cache.invalidate_owner(user.user_id)
+    return validate_contract_out(new_contract)
 
 
 async def update_content(
@@ -257,11 +249,7 @@ async def update_content(
     contract_id: str,
     payload: UpdateContractContentRequest,
 ) -> None:
-    contract = await repo.get_contract(session, contract_id)
-    if not contract:
-        raise ServiceError(404, "Contrato no encontrado.")
-    if contract.owner_user_id != user.user_id:
-        raise ServiceError(403, "No tienes acceso a este contrato.")
+    await _authorized_contract(session, user, contract_id)
 
     next_version = await repo.get_next_version_number(session, contract_id)
     await repo.add_version(
@@ -288,14 +276,10 @@ async def update_content(
 async def list_versions(
     session: AsyncSession, user: UserContext, contract_id: str
 ) -> list[ContractVersionOut]:
-    contract = await repo.get_contract(session, contract_id)
-    if not contract:
-        raise ServiceError(404, "Contrato no encontrado.")
-    if contract.owner_user_id != user.user_id:
-        raise ServiceError(403, "No tienes acceso a este contrato.")
+    await _authorized_contract(session, user, contract_id)
 
     versions = await repo.list_versions(session, contract_id)
-    return [ContractVersionOut.model_validate(version) for version in versions]
+    return CONTRACT_VERSION_LIST.validate_python(versions, from_attributes=True)
 
 
 async def update_status(
@@ -304,17 +288,13 @@ async def update_status(
     contract_id: str,
     payload: UpdateContractStatusRequest,
 ) -> None:
-    contract = await repo.get_contract(session, contract_id)
-    if not contract:
-        raise ServiceError(404, "Contrato no encontrado.")
-    if contract.owner_user_id != user.user_id:
-        raise ServiceError(403, "No tienes acceso a este contrato.")
+    contract = await _authorized_contract(session, user, contract_id)
 
     current_status = contract.status
     new_status = payload.status.value
     if new_status == current_status:
         raise ServiceError(400, "El contrato ya tiene ese estado.")
-    if new_status not in ALLOWED_TRANSITIONS.get(current_status, []):
+    if new_status not in ALLOWED_TRANSITION_SETS.get(current_status, frozenset()):
         raise ServiceError(400, "Transición de estado no permitida.")
     if new_status == "CANCELLED" and not payload.reason:
         raise ServiceError(400, "El estado CANCELLED requiere reason.")
@@ -325,13 +305,7 @@ async def update_status(
         if not await repo.all_parties_signed(session, contract_id):
             raise ServiceError(409, "Todas las partes deben estar SIGNED.")
 
-    update_fields: dict[str, Any] = {"status": new_status}
-    if new_status == "SIGNED":
-        update_fields["signed_at"] = datetime.utcnow()
-    else:
-        update_fields["signed_at"] = None
-
-    await repo.update_contract_fields(session, contract_id, update_fields)
+    await repo.update_contract_status(session, contract_id, new_status)
     await repo.log_activity(
         session=session,
         contract_id=contract_id,
@@ -341,30 +315,23 @@ async def update_status(
         details={"previousStatus": current_status, "newStatus": new_status, "reason": payload.reason},
     )
     await session.commit()
+    await cache.invalidate_owner(user.user_id)
 
 
 async def get_transitions(
     session: AsyncSession, user: UserContext, contract_id: str
 ) -> dict[str, Any]:
-    contract = await repo.get_contract(session, contract_id)
-    if not contract:
-        raise ServiceError(404, "Contrato no encontrado.")
-    if contract.owner_user_id != user.user_id:
-        raise ServiceError(403, "No tienes acceso a este contrato.")
+    contract = await _authorized_contract(session, user, contract_id)
     return {
         "currentStatus": contract.status,
-        "allowedTransitions": ALLOWED_TRANSITIONS.get(contract.status, []),
+        "allowedTransitions": list(ALLOWED_TRANSITIONS.get(contract.status, ())),
     }
 
 
 async def list_activity(
     session: AsyncSession, user: UserContext, contract_id: str
 ) -> list[Any]:
-    contract = await repo.get_contract(session, contract_id)
-    if not contract:
-        raise ServiceError(404, "Contrato no encontrado.")
-    if contract.owner_user_id != user.user_id:
-        raise ServiceError(403, "No tienes acceso a este contrato.")
+    await _authorized_contract(session, user, contract_id)
 
     logs = await repo.list_activity_logs(session, contract_id)
     return logs
@@ -373,24 +340,16 @@ async def list_activity(
 async def list_parties(
     session: AsyncSession, user: UserContext, contract_id: str
 ) -> list[ContractPartyOut]:
-    contract = await repo.get_contract(session, contract_id)
-    if not contract:
-        raise ServiceError(404, "Contrato no encontrado.")
-    if contract.owner_user_id != user.user_id:
-        raise ServiceError(403, "No tienes acceso a este contrato.")
+    await _authorized_contract(session, user, contract_id)
 
     parties = await repo.list_parties(session, contract_id)
-    return [ContractPartyOut.model_validate(party) for party in parties]
+    return PARTY_OUT_LIST.validate_python(parties, from_attributes=True)
 
 
 async def add_party(
     session: AsyncSession, user: UserContext, contract_id: str, payload: AddPartyRequest
 ) -> None:
-    contract = await repo.get_contract(session, contract_id)
-    if not contract:
-        raise ServiceError(404, "Contrato no encontrado.")
-    if contract.owner_user_id != user.user_id:
-        raise ServiceError(403, "No tienes acceso a este contrato.")
+    contract = await _authorized_contract(session, user, contract_id)
     if contract.status == "SIGNED":
         raise ServiceError(409, "No se pueden agregar partes a un contrato firmado.")
 
@@ -415,16 +374,13 @@ async def add_party(
         details={"partyAdded": payload.email},
     )
     await session.commit()
+    await cache.invalidate_owner(user.user_id)
 
 
 async def remove_party(
     session: AsyncSession, user: UserContext, contract_id: str, party_id: str
 ) -> None:
-    contract = await repo.get_contract(session, contract_id)
-    if not contract:
-        raise ServiceError(404, "Contrato no encontrado.")
-    if contract.owner_user_id != user.user_id:
-        raise ServiceError(403, "No tienes acceso a este contrato.")
+    contract = await _authorized_contract(session, user, contract_id)
     if contract.status == "SIGNED":
         raise ServiceError(409, "No se puede remover una parte de un contrato firmado.")
 
@@ -441,54 +397,63 @@ async def remove_party(
         details={"partyRemoved": party_id},
     )
     await session.commit()
+    await cache.invalidate_owner(user.user_id)
 
 
 async def list_recent_contracts(
     session: AsyncSession, user: UserContext
 ) -> list[ContractOut]:
-    contracts = await repo.list_recent_contracts(session, user.user_id)
-    return [ContractOut.model_validate(contract) for contract in contracts]
+    async def load() -> list[dict[str, Any]]:
+        contracts = await repo.list_recent_contracts(session, user.user_id)
+        return CONTRACT_OUT_LIST.dump_python(
+            CONTRACT_OUT_LIST.validate_python(contracts, from_attributes=True),
+            mode="json",
+            by_alias=True,
+        )
+
+    cached = await cache.cache_aside(cache.recent_key(user.user_id), load)
+    return CONTRACT_OUT_LIST.validate_python(cached)
 
 
 async def list_pending_contracts(
     session: AsyncSession, user: UserContext
 ) -> list[ContractOut]:
     contracts = await repo.list_pending_contracts(session, user.user_id)
-    return [ContractOut.model_validate(contract) for contract in contracts]
+    return CONTRACT_OUT_LIST.validate_python(contracts, from_attributes=True)
 
 
 async def stats(session: AsyncSession, user: UserContext) -> ContractStatsOut:
-    status_counts = await repo.contract_status_counts(session, user.user_id)
-    total = sum(status_counts.values())
-    pending_signatures = await repo.count_pending_signatures(session, user.user_id)
-    signed_this_month = await repo.count_signed_this_month(session, user.user_id)
-    return ContractStatsOut(
-        total=total,
-        byStatus=status_counts,
-        pendingSignatures=pending_signatures,
-        signedThisMonth=signed_this_month,
-    )
+    async def load() -> dict[str, Any]:
+        status_counts, pending_signatures, signed_this_month = await repo.dashboard_counts(
+            session, user.user_id
+        )
+        total = sum(status_counts.values())
+        return ContractStatsOut(
+            total=total,
+            byStatus=status_counts,
+            pendingSignatures=pending_signatures,
+            signedThisMonth=signed_this_month,
+        ).model_dump(mode="json", by_alias=True)
+
+    cached = await cache.cache_aside(cache.stats_key(user.user_id), load)
+    return ContractStatsOut.model_validate(cached)
 
 
 async def bulk_download(
     session: AsyncSession, user: UserContext, contract_ids: Iterable[str]
-) -> bytes:
-    contracts = await repo.list_contracts_by_ids(session, user.user_id, contract_ids)
-    if len(contracts) != len(set(contract_ids)):
+) -> Iterator[bytes]:
+    ids = list(dict.fromkeys(contract_ids))
+    contracts = await repo.list_contracts_by_ids(session, user.user_id, ids)
+    if len(contracts) != len(ids):
         raise ServiceError(404, "Uno o más contratos no fueron encontrados.")
 
-    content_map: dict[str, str] = {}
+    content_map = await repo.get_latest_contents(
+        session, [contract.id for contract in contracts]
+    )
+    zip_stream = ZipStream(compress_type=ZIP_DEFLATED, compress_level=ZIP_COMPRESS_LEVEL)
     for contract in contracts:
-        latest_version = await repo.get_latest_version(session, contract.id)
-        content_map[contract.id] = latest_version.content if latest_version else ""
-
-    buffer = BytesIO()
-    with ZipFile(buffer, mode="w", compression=ZIP_DEFLATED) as zip_file:
-        for contract in contracts:
-            filename = f"contract_{contract.id}.html"
-            zip_file.writestr(filename, content_map.get(contract.id, ""))
-
-    return buffer.getvalue()
+        zip_stream.add(content_map.get(contract.id, ""), f"contract_{contract.id}.html")
+    return iter(zip_stream)
 
 
 async def public_view(
@@ -499,13 +464,10 @@ async def public_view(
         raise ServiceError(404, "Contrato no encontrado.")
 
     latest_version = await repo.get_latest_version(session, contract_id)
-    parties = await repo.list_parties(session, contract_id)
-    if not parties:
+    selected_party = await repo.get_public_view_party(session, contract_id)
+    if not selected_party:
         raise ServiceError(404, "No hay partes registradas para este contrato.")
 
-    selected_party = next(
-        (party for party in parties if party.signature_status != "SIGNED"), parties[0]
-    )
     return PublicContractViewOut(
         id=contract.id,
         title=contract.title,